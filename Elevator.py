@@ -1,8 +1,16 @@
-from operator import attrgetter
+from collections import deque
 from enum import Enum
+import heapq
 import logging
 
-logging.basicConfig(level=logging.DEBUG)
+try:
+    import numpy as np
+except ImportError:
+    # numpy is only needed for ElevatorBank.
+    np = None
+
+
+logger = logging.getLogger(__name__)
 
 
 class Direction(Enum):
@@ -14,7 +22,15 @@ class Direction(Enum):
         return self.name.capitalize()
 
 
+# Elevators track their direction as a plain int on the hot path, Direction is only
+# used at the PickupRequest boundary and for logging.
+_DOWN, _IDLE, _UP = Direction.DOWN.value, Direction.IDLE.value, Direction.UP.value
+# Log names for each direction, indexed by the direction int shifted by one
+_DIRECTION_NAMES = tuple(str(Direction(value)) for value in (_DOWN, _IDLE, _UP))
+
+
 class PickupRequest:
+    __slots__ = ("time", "floor", "direction", "destination")
 
     def __init__(self, time, floor, direction, destination):
         self.time = time
@@ -23,227 +39,530 @@ class PickupRequest:
         self.destination = destination
 
 
+def _move_core(
+    current_floor,
+    direction,
+    dest_min,
+    dest_max,
+    has_destinations,
+    pickup_floor,
+    has_pickup,
+):
+    # Integer-only state machine for a single tick of elevator motion. Returns the
+    # new floor and the new direction as an int.
+
+    # If elevator is idle then handle the first available pickup or drop off request.
+    # The step is the sign of the distance to the target, which is also the direction.
+    if direction == _IDLE:
+        if has_pickup:
+            delta = int(pickup_floor > current_floor) - int(
+                pickup_floor < current_floor
+            )
+            return current_floor + delta, delta
+
+        elif has_destinations:
+            delta = int(dest_max > current_floor) - int(dest_max < current_floor)
+            return current_floor + delta, delta
+
+    elif direction == _UP:
+        # If elevator is moving up then ensure that a pick up or dropoff request exists for a higher floor, if not then start to move down or go idle.
+        if (has_destinations and dest_max > current_floor) or (
+            has_pickup and pickup_floor > current_floor
+        ):
+            return current_floor + 1, _UP
+
+        elif has_destinations or has_pickup:
+            return current_floor - 1, _DOWN
+        else:
+            return current_floor, _IDLE
+
+    elif direction == _DOWN:
+
+        # If elevator is moving down then ensure that a pick up or dropoff request exists for a lower floor, if not then start to move up or go idle.
+        if (has_destinations and dest_min < current_floor) or (
+            has_pickup and pickup_floor < current_floor
+        ):
+            return current_floor - 1, _DOWN
+
+        elif has_destinations or has_pickup:
+            return current_floor + 1, _UP
+        else:
+            return current_floor, _IDLE
+
+    return current_floor, direction
+
+
 class Elevator:
 
     def __init__(self, floors, starting_floor=1):
         self.floors = floors
-        self.direction = Direction.IDLE
+        self.direction = _IDLE
         self.current_floor = starting_floor
-        self.destination_requests = set()
-        self.pickup_requests = []
+        # Bit n is set when floor destination_base + n has been requested as a
+        # destination. The base drops when a lower floor is requested.
+        self.destination_mask = 0
+        self.destination_base = 0
+        self.pickup_requests = deque()
 
     def has_pending_requests(self):
-        return self.destination_requests or len(self.pickup_requests) > 0
+        return self.destination_mask != 0 or len(self.pickup_requests) > 0
+
+    @property
+    def destination_requests(self):
+        mask = self.destination_mask
+        return frozenset(
+            self.destination_base + bit
+            for bit in range(mask.bit_length())
+            if mask >> bit & 1
+        )
 
     def request_car(self, request):
         self.pickup_requests.append(request)
 
     def report_state(self, time):
-        logging.info(
-            {
-                "time": time,
-                "direction": str(self.direction),
-                "floor": self.current_floor,
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                {
+                    "time": time,
+                    "direction": _DIRECTION_NAMES[self.direction + 1],
+                    "floor": self.current_floor,
+                }
+            )
 
     def request_floor(self, floor):
-        self.destination_requests.add(floor)
+        if floor < self.destination_base:
+            self.destination_mask <<= self.destination_base - floor
+            self.destination_base = floor
+        self.destination_mask |= 1 << (floor - self.destination_base)
 
     def report_pickup(self, time):
-        logging.debug(f"Time: {time} - Picking up passengers at {self.current_floor}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Time: {time} - Picking up passengers at {self.current_floor}"
+            )
 
     def report_dropoff(self, time):
-        logging.debug(f"Time: {time} - Dropping off passengers at {self.current_floor}")
-
-    def has_pickup_requests(self):
-        return len(self.pickup_requests) > 0
-
-    def has_pickup_request_at_current_floor(self):
-        return (
-            self.has_pickup_requests()
-            and self.pickup_requests[0].floor == self.current_floor
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Time: {time} - Dropping off passengers at {self.current_floor}"
+            )
 
     def has_dropoff_request_at_current_floor(self):
-        return self.current_floor in self.destination_requests
-
-    def handle_parallel_requests(self, time):
-        # Pickup any passengers along the way of the current request
-        if self.has_pickup_requests():
-            pickups_to_discard = []
-
-            for request_index, request in enumerate(self.pickup_requests):
-
-                # Handle all requests moving in the same direction
-                if request.floor == self.current_floor and (
-                    self.has_pickup_requests()
-                    and (self.pickup_requests[0].direction == request.direction)
-                    and (request.direction == self.direction)
-                ):
-                    pickup_request = self.pickup_requests[request_index]
-                    pickups_to_discard.append(request_index)
-                    self.report_pickup(time)
-                    self.destination_requests.add(pickup_request.destination)
-
-                for pickup in sorted(pickups_to_discard, reverse=True):
-                    self.pickup_requests.pop(pickup)
-
-    def pickup_at_current_floor(self, time):
-        if self.has_pickup_request_at_current_floor():
+        bit = self.current_floor - self.destination_base
+        return bit >= 0 and bool(self.destination_mask >> bit & 1)
+
+    def _service_current_floor(self, time):
+        # Pickup the lead request and drop off passengers at the current floor before
+        # the elevator leaves it.
+        current_floor = self.current_floor
+        pickups = self.pickup_requests
+        if pickups and pickups[0].floor == current_floor:
+            request = pickups.popleft()
             self.report_pickup(time)
-            self.direction = self.pickup_requests[0].direction
-            self.destination_requests.add(self.pickup_requests[0].destination)
-            self.pickup_requests.pop(0)
+            self.direction = request.direction.value
+            self.request_floor(request.destination)
 
-    def drop_off_at_current_floor(self, time):
         if self.has_dropoff_request_at_current_floor():
             self.report_dropoff(time)
-            self.destination_requests.remove(self.current_floor)
+            self.destination_mask &= ~(1 << (current_floor - self.destination_base))
+
+    def handle_parallel_requests(self, time):
+        # Pickup any passengers along the way of the current request
+        pickups = self.pickup_requests
+        if not pickups:
+            return
+
+        current_floor = self.current_floor
+        direction = self.direction
+
+        # A single pending request is always the lead request, check it directly
+        if len(pickups) == 1:
+            request = pickups[0]
+            if request.floor == current_floor and request.direction.value == direction:
+                pickups.pop()
+                self.report_pickup(time)
+                self.request_floor(request.destination)
+            return
+
+        lead_direction = pickups[0].direction
+
+        # Filter in place by rotating the queue once, requests that are not picked
+        # up are appended back in their original order.
+        for _ in range(len(pickups)):
+            request = pickups.popleft()
+
+            # Handle all requests moving in the same direction
+            if (
+                request.floor == current_floor
+                and request.direction == lead_direction
+                and request.direction.value == direction
+            ):
+                self.report_pickup(time)
+                self.request_floor(request.destination)
+            else:
+                pickups.append(request)
 
     def move(self, time):
 
-        self.pickup_at_current_floor(time)
-        self.drop_off_at_current_floor(time)
+        self._service_current_floor(time)
+
+        # Bind the request state once, handle_parallel_requests may add destinations so
+        # the mask is re-read afterwards.
+        pickups = self.pickup_requests
+        destination_mask = self.destination_mask
+        # bit_length counts from one, so the floor of the highest set bit is
+        # bit_length() + destination_base - 1
+        bit_offset = self.destination_base - 1
+
+        # The lowest and highest set bits are the lowest and highest destinations
+        self.current_floor, self.direction = _move_core(
+            self.current_floor,
+            self.direction,
+            (destination_mask & -destination_mask).bit_length() + bit_offset,
+            destination_mask.bit_length() + bit_offset,
+            destination_mask != 0,
+            pickups[0].floor if pickups else 0,
+            len(pickups) > 0,
+        )
 
-        # If elevator is idle then handle the first available pickup or drop off request.
-        if self.direction == Direction.IDLE:
-            if self.has_pickup_requests():
-                if self.pickup_requests[0].floor > self.current_floor:
-                    self.current_floor += 1
-                    self.direction = Direction.UP
-
-                elif self.pickup_requests[0].floor < self.current_floor:
-                    self.current_floor -= 1
-                    self.direction = Direction.DOWN
-
-            elif self.destination_requests:
-                if max(self.destination_requests) > self.current_floor:
-                    self.current_floor += 1
-                    self.direction = Direction.UP
-                else:
-                    self.current_floor -= 1
-                    self.direction = Direction.DOWN
-
-        elif self.direction == Direction.UP:
-            # If elevator is moving up then ensure that a pick up or dropoff request exists for a higher floor, if not then start to move down or go idle.
-            if (
-                self.destination_requests
-                and max(self.destination_requests) > self.current_floor
-            ) or (
-                self.has_pickup_requests()
-                and self.pickup_requests[0].floor > self.current_floor
-            ):
-                self.current_floor += 1
+        self.handle_parallel_requests(time)
 
-            else:
-                if self.destination_requests or self.has_pickup_requests():
-                    self.direction = Direction.DOWN
-                    self.current_floor -= 1
-                else:
-                    self.direction = Direction.IDLE
+        # If no requests exist then become idle
+        if not pickups and not self.destination_mask:
+            self.direction = _IDLE
 
-        elif self.direction == Direction.DOWN:
+        self.report_state(time)
 
-            # If elevator is moving down then ensure that a pick up or dropoff request exists for a lower floor, if not then start to move up or go idle.
-            if (
-                self.destination_requests
-                and min(self.destination_requests) < self.current_floor
-                or (
-                    self.has_pickup_requests()
-                    and self.pickup_requests[0].floor < self.current_floor
+
+class ElevatorBank:
+    # Simulates many independent elevators at once. Per-elevator state is stored as
+    # numpy arrays so the motion update for every elevator is a handful of vectorized
+    # operations per tick, pickup queues and destinations stay as Python containers.
+
+    def __init__(self, count, starting_floor=1):
+        if np is None:
+            raise ImportError("ElevatorBank requires numpy")
+
+        self.time = 0
+        self.current_floor = np.full(count, starting_floor, dtype=np.int32)
+        self.direction = np.full(count, _IDLE, dtype=np.int8)
+        self.dest_min = np.zeros(count, dtype=np.int32)
+        self.dest_max = np.zeros(count, dtype=np.int32)
+        self.dest_count = np.zeros(count, dtype=np.int32)
+        # Head of each pickup queue, plus the range of floors anywhere in the queue
+        self.pickup_floor = np.zeros(count, dtype=np.int32)
+        self.pickup_direction = np.zeros(count, dtype=np.int8)
+        self.pickup_min = np.zeros(count, dtype=np.int32)
+        self.pickup_max = np.zeros(count, dtype=np.int32)
+        self.has_pickup = np.zeros(count, dtype=bool)
+        self.destination_requests = [set() for _ in range(count)]
+        self.pickup_requests = [deque() for _ in range(count)]
+
+    def has_pending_requests(self):
+        return bool(self.has_pickup.any() or self.dest_count.any())
+
+    def request_car(self, index, request):
+        pickups = self.pickup_requests[index]
+        floor = request.floor
+        if pickups:
+            self.pickup_min[index] = min(self.pickup_min[index], floor)
+            self.pickup_max[index] = max(self.pickup_max[index], floor)
+        else:
+            self.has_pickup[index] = True
+            self.pickup_floor[index] = floor
+            self.pickup_direction[index] = request.direction.value
+            self.pickup_min[index] = floor
+            self.pickup_max[index] = floor
+        pickups.append(request)
+
+    def request_floor(self, index, floor):
+        destinations = self.destination_requests[index]
+        if floor in destinations:
+            return
+
+        if destinations:
+            self.dest_min[index] = min(self.dest_min[index], floor)
+            self.dest_max[index] = max(self.dest_max[index], floor)
+        else:
+            self.dest_min[index] = floor
+            self.dest_max[index] = floor
+        destinations.add(floor)
+        self.dest_count[index] = len(destinations)
+
+    def report_state(self, time):
+        if logger.isEnabledFor(logging.INFO):
+            for index in range(len(self.current_floor)):
+                logger.info(
+                    {
+                        "time": time,
+                        "elevator": index,
+                        "direction": _DIRECTION_NAMES[self.direction[index] + 1],
+                        "floor": int(self.current_floor[index]),
+                    }
                 )
-            ):
-                self.current_floor -= 1
 
+    def report_pickup(self, index, time):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Time: {time} - Elevator {index} picking up passengers at "
+                f"{self.current_floor[index]}"
+            )
+
+    def report_dropoff(self, index, time):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Time: {time} - Elevator {index} dropping off passengers at "
+                f"{self.current_floor[index]}"
+            )
+
+    def sync_pickups(self, index):
+        # Refresh the cached head and floor range after pickups at the current floor
+        pickups = self.pickup_requests[index]
+        self.has_pickup[index] = bool(pickups)
+        if not pickups:
+            return
+
+        self.pickup_floor[index] = pickups[0].floor
+        self.pickup_direction[index] = pickups[0].direction.value
+
+        # Only rescan the queue when a bound of the range was picked up
+        current_floor = self.current_floor[index]
+        if current_floor in (self.pickup_min[index], self.pickup_max[index]):
+            floors = [request.floor for request in pickups]
+            self.pickup_min[index] = min(floors)
+            self.pickup_max[index] = max(floors)
+
+    def handle_parallel_requests(self, index, time):
+        # Pickup any passengers along the way of the current request
+        pickups = self.pickup_requests[index]
+        current_floor = self.current_floor[index]
+        direction = self.direction[index]
+        lead_direction = pickups[0].direction
+        pending = len(pickups)
+
+        # Filter in place by rotating the queue once, as in Elevator
+        for _ in range(pending):
+            request = pickups.popleft()
+
+            # Handle all requests moving in the same direction
+            if (
+                request.floor == current_floor
+                and request.direction == lead_direction
+                and request.direction.value == direction
+            ):
+                self.report_pickup(index, time)
+                self.request_floor(index, request.destination)
             else:
-                if self.destination_requests or self.has_pickup_requests():
-                    self.direction = Direction.UP
-                    self.current_floor += 1
-                else:
-                    self.direction = Direction.IDLE
+                pickups.append(request)
+
+        if len(pickups) != pending:
+            self.sync_pickups(index)
+
+    def pickup_at_current_floor(self, index, time):
+        request = self.pickup_requests[index].popleft()
+        self.report_pickup(index, time)
+        self.direction[index] = request.direction.value
+        self.request_floor(index, request.destination)
+        self.sync_pickups(index)
+
+    def drop_off_at_current_floor(self, index, time):
+        destinations = self.destination_requests[index]
+        current_floor = int(self.current_floor[index])
+        if current_floor not in destinations:
+            return
+
+        self.report_dropoff(index, time)
+        destinations.remove(current_floor)
+        self.dest_count[index] = len(destinations)
+
+        # Only rescan the remaining destinations when a bound was dropped off
+        if not destinations:
+            return
+        elif current_floor == self.dest_min[index]:
+            self.dest_min[index] = min(destinations)
+        elif current_floor == self.dest_max[index]:
+            self.dest_max[index] = max(destinations)
+
+    def move_all(self):
+        # Vectorized equivalent of _move_core across every elevator. All masks are
+        # computed from the pre-move state before any floor or direction is updated.
+        floor = self.current_floor
+        has_destinations = self.dest_count > 0
+        has_pickup = self.has_pickup
+        pending = has_destinations | has_pickup
+
+        pickup_above = has_pickup & (self.pickup_floor > floor)
+        pickup_below = has_pickup & (self.pickup_floor < floor)
+        destination_above = has_destinations & (self.dest_max > floor)
+        destination_below = has_destinations & (self.dest_min < floor)
+
+        idle = self.direction == _IDLE
+        going_up = self.direction == _UP
+        going_down = self.direction == _DOWN
 
-        self.handle_parallel_requests(time)
+        # If elevator is idle then handle the first available pickup or drop off request.
+        idle_destination = idle & ~has_pickup & has_destinations
+        idle_up = idle & (pickup_above | (idle_destination & destination_above))
+        idle_down = idle & (pickup_below | (idle_destination & ~destination_above))
+
+        # Moving elevators keep going while requests remain ahead, otherwise turn
+        # around or go idle.
+        up_ahead = going_up & (destination_above | pickup_above)
+        down_ahead = going_down & (destination_below | pickup_below)
+        turn_down = going_up & ~up_ahead & pending
+        turn_up = going_down & ~down_ahead & pending
+        stop = (going_up | going_down) & ~pending
+
+        step_up = idle_up | up_ahead | turn_up
+        step_down = idle_down | down_ahead | turn_down
+
+        floor[step_up] += 1
+        floor[step_down] -= 1
+        self.direction[step_up] = _UP
+        self.direction[step_down] = _DOWN
+        self.direction[stop] = _IDLE
+
+    def move(self, time):
+        at_pickup = self.has_pickup & (self.pickup_floor == self.current_floor)
+        for index in np.flatnonzero(at_pickup):
+            self.pickup_at_current_floor(index, time)
+
+        # The cached bounds rule out elevators that cannot have a drop off here
+        may_drop_off = (
+            (self.dest_count > 0)
+            & (self.dest_min <= self.current_floor)
+            & (self.dest_max >= self.current_floor)
+        )
+        for index in np.flatnonzero(may_drop_off):
+            self.drop_off_at_current_floor(index, time)
+
+        self.move_all()
+
+        # Only elevators travelling with their lead request and with a queued request
+        # in range of their new floor can pick anyone up along the way
+        may_pick_up = (
+            self.has_pickup
+            & (self.direction != _IDLE)
+            & (self.pickup_direction == self.direction)
+            & (self.pickup_min <= self.current_floor)
+            & (self.pickup_max >= self.current_floor)
+        )
+        for index in np.flatnonzero(may_pick_up):
+            self.handle_parallel_requests(index, time)
 
         # If no requests exist then become idle
-        if not self.has_pickup_requests() and not self.destination_requests:
-            self.direction = Direction.IDLE
+        self.direction[~(self.has_pickup | (self.dest_count > 0))] = _IDLE
 
         self.report_state(time)
 
+    def run(self, schedules):
+        # Batch counterpart of ElevatorController.run, schedules[index] holds the
+        # pickup requests for elevator index. Same-time requests for an elevator are
+        # released newest first, as in ElevatorController.
+        requests = [
+            (request.time, index, -order, request)
+            for index, schedule in enumerate(schedules)
+            for order, request in enumerate(schedule)
+        ]
+        heapq.heapify(requests)
+
+        while requests or self.has_pending_requests():
+            # Fast-forward while every elevator is idle until the next request arrives
+            if not self.has_pending_requests() and requests[0][0] > self.time:
+                self.time = requests[0][0]
+
+            while requests and requests[0][0] <= self.time:
+                _, index, _, request = heapq.heappop(requests)
+                self.request_car(index, request)
+            self.move(self.time)
+            self.time += 1
+
 
 class ElevatorController:
 
     def __init__(self, elevator, requests):
         self.elevator = elevator
-        self.requests = sorted(requests, key=attrgetter("time"), reverse=True)
+        # Min-heap keyed on time. Requests with the same time are released newest
+        # first, matching the previous reverse sort and pop.
+        self.requests = [
+            (request.time, -index, request) for index, request in enumerate(requests)
+        ]
+        heapq.heapify(self.requests)
         self.time = 0
 
     def run(self):
 
         # Simulate sending timed requests
         while len(self.requests) > 0 or self.elevator.has_pending_requests():
-            while len(self.requests) > 0 and self.requests[-1].time <= self.time:
-                new_request = self.requests.pop()
+            # Fast-forward through idle ticks until the next request arrives
+            if (
+                not self.elevator.has_pending_requests()
+                and self.requests[0][0] > self.time
+            ):
+                self.time = self.requests[0][0]
+
+            while self.requests and self.requests[0][0] <= self.time:
+                _, _, new_request = heapq.heappop(self.requests)
                 self.elevator.request_car(new_request)
             self.elevator.move(self.time)
             self.time += 1
 
 
-requests = [
-    {"time": 1, "floor": 5, "direction": Direction.DOWN, "destination": 2},
-    {"time": 2, "floor": 8, "direction": Direction.UP, "destination": 10},
-    {"time": 3, "floor": 4, "direction": Direction.UP, "destination": 9},
-    {"time": 7, "floor": 5, "direction": Direction.DOWN, "destination": 1},
-]
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
 
+    requests = [
+        {"time": 1, "floor": 5, "direction": Direction.DOWN, "destination": 2},
+        {"time": 2, "floor": 8, "direction": Direction.UP, "destination": 10},
+        {"time": 3, "floor": 4, "direction": Direction.UP, "destination": 9},
+        {"time": 7, "floor": 5, "direction": Direction.DOWN, "destination": 1},
+    ]
 
-floors = 10
-elevator = Elevator(floors)
+    floors = 10
+    elevator = Elevator(floors)
 
-controller = ElevatorController(
-    requests=list([PickupRequest(**request) for request in requests]), elevator=elevator
-)
+    controller = ElevatorController(
+        requests=[PickupRequest(**request) for request in requests], elevator=elevator
+    )
 
-controller.run()
+    controller.run()
 
 
 """
 
 The requests above will output the following logs:
 
-INFO:root:{'time': 0, 'direction': 'Idle', 'floor': 1}
-INFO:root:{'time': 1, 'direction': 'Up', 'floor': 2}
-INFO:root:{'time': 2, 'direction': 'Up', 'floor': 3}
-INFO:root:{'time': 3, 'direction': 'Up', 'floor': 4}
-INFO:root:{'time': 4, 'direction': 'Up', 'floor': 5}
-DEBUG:root:Time: 5 - Picking up passengers at 5
-INFO:root:{'time': 5, 'direction': 'Down', 'floor': 4}
-INFO:root:{'time': 6, 'direction': 'Down', 'floor': 3}
-INFO:root:{'time': 7, 'direction': 'Down', 'floor': 2}
-DEBUG:root:Time: 8 - Dropping off passengers at 2
-INFO:root:{'time': 8, 'direction': 'Up', 'floor': 3}
-DEBUG:root:Time: 9 - Picking up passengers at 4
-INFO:root:{'time': 9, 'direction': 'Up', 'floor': 4}
-INFO:root:{'time': 10, 'direction': 'Up', 'floor': 5}
-INFO:root:{'time': 11, 'direction': 'Up', 'floor': 6}
-INFO:root:{'time': 12, 'direction': 'Up', 'floor': 7}
-DEBUG:root:Time: 13 - Picking up passengers at 8
-INFO:root:{'time': 13, 'direction': 'Up', 'floor': 8}
-INFO:root:{'time': 14, 'direction': 'Up', 'floor': 9}
-DEBUG:root:Time: 15 - Dropping off passengers at 9
-INFO:root:{'time': 15, 'direction': 'Up', 'floor': 10}
-DEBUG:root:Time: 16 - Dropping off passengers at 10
-INFO:root:{'time': 16, 'direction': 'Down', 'floor': 9}
-INFO:root:{'time': 17, 'direction': 'Down', 'floor': 8}
-INFO:root:{'time': 18, 'direction': 'Down', 'floor': 7}
-INFO:root:{'time': 19, 'direction': 'Down', 'floor': 6}
-DEBUG:root:Time: 20 - Picking up passengers at 5
-INFO:root:{'time': 20, 'direction': 'Down', 'floor': 5}
-INFO:root:{'time': 21, 'direction': 'Down', 'floor': 4}
-INFO:root:{'time': 22, 'direction': 'Down', 'floor': 3}
-INFO:root:{'time': 23, 'direction': 'Down', 'floor': 2}
-INFO:root:{'time': 24, 'direction': 'Down', 'floor': 1}
-DEBUG:root:Time: 25 - Dropping off passengers at 1
-INFO:root:{'time': 25, 'direction': 'Idle', 'floor': 1}
+INFO:__main__:{'time': 1, 'direction': 'Up', 'floor': 2}
+INFO:__main__:{'time': 2, 'direction': 'Up', 'floor': 3}
+INFO:__main__:{'time': 3, 'direction': 'Up', 'floor': 4}
+INFO:__main__:{'time': 4, 'direction': 'Up', 'floor': 5}
+DEBUG:__main__:Time: 5 - Picking up passengers at 5
+INFO:__main__:{'time': 5, 'direction': 'Down', 'floor': 4}
+INFO:__main__:{'time': 6, 'direction': 'Down', 'floor': 3}
+INFO:__main__:{'time': 7, 'direction': 'Down', 'floor': 2}
+DEBUG:__main__:Time: 8 - Dropping off passengers at 2
+INFO:__main__:{'time': 8, 'direction': 'Up', 'floor': 3}
+DEBUG:__main__:Time: 9 - Picking up passengers at 4
+INFO:__main__:{'time': 9, 'direction': 'Up', 'floor': 4}
+INFO:__main__:{'time': 10, 'direction': 'Up', 'floor': 5}
+INFO:__main__:{'time': 11, 'direction': 'Up', 'floor': 6}
+INFO:__main__:{'time': 12, 'direction': 'Up', 'floor': 7}
+DEBUG:__main__:Time: 13 - Picking up passengers at 8
+INFO:__main__:{'time': 13, 'direction': 'Up', 'floor': 8}
+INFO:__main__:{'time': 14, 'direction': 'Up', 'floor': 9}
+DEBUG:__main__:Time: 15 - Dropping off passengers at 9
+INFO:__main__:{'time': 15, 'direction': 'Up', 'floor': 10}
+DEBUG:__main__:Time: 16 - Dropping off passengers at 10
+INFO:__main__:{'time': 16, 'direction': 'Down', 'floor': 9}
+INFO:__main__:{'time': 17, 'direction': 'Down', 'floor': 8}
+INFO:__main__:{'time': 18, 'direction': 'Down', 'floor': 7}
+INFO:__main__:{'time': 19, 'direction': 'Down', 'floor': 6}
+DEBUG:__main__:Time: 20 - Picking up passengers at 5
+INFO:__main__:{'time': 20, 'direction': 'Down', 'floor': 5}
+INFO:__main__:{'time': 21, 'direction': 'Down', 'floor': 4}
+INFO:__main__:{'time': 22, 'direction': 'Down', 'floor': 3}
+INFO:__main__:{'time': 23, 'direction': 'Down', 'floor': 2}
+INFO:__main__:{'time': 24, 'direction': 'Down', 'floor': 1}
+DEBUG:__main__:Time: 25 - Dropping off passengers at 1
+INFO:__main__:{'time': 25, 'direction': 'Idle', 'floor': 1}
 """
@@ -0,0 +1,243 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+# Compiled counterpart of ElevatorController.run driving a single Elevator. Build in
+# place with `cythonize -i elevator_core.pyx`. The whole simulation loop runs in C:
+# requests are copied into int arrays once per run and no Python code is called per
+# tick unless a state trace is recorded. Direction values match the Direction enum.
+
+cdef enum:
+    DOWN = -1
+    IDLE = 0
+    UP = 1
+
+
+cdef class CElevator:
+    cdef public int current_floor
+    cdef public int direction
+    cdef public long time
+
+    # Pickup requests, indexed by submission order
+    cdef int[::1] request_floor
+    cdef int[::1] request_direction
+    cdef int[::1] request_destination
+
+    # Pickup queue of request indices, live entries are queue[queue_start:queue_end]
+    cdef int[::1] queue
+    cdef int queue_start
+    cdef int queue_end
+
+    # Destination flags for floors lowest_floor..lowest_floor + len - 1
+    cdef unsigned char[::1] destinations
+    cdef int lowest_floor
+    cdef int dest_count
+    cdef int dest_min
+    cdef int dest_max
+
+    def __init__(self, starting_floor=1):
+        self.current_floor = starting_floor
+        self.direction = IDLE
+        self.time = 0
+
+    cdef inline bint has_pending_requests(self) noexcept nogil:
+        return self.queue_end > self.queue_start or self.dest_count > 0
+
+    cdef inline void request_floor_at(self, int floor) noexcept nogil:
+        if self.destinations[floor - self.lowest_floor]:
+            return
+
+        self.destinations[floor - self.lowest_floor] = 1
+        if self.dest_count == 0:
+            self.dest_min = floor
+            self.dest_max = floor
+        elif floor < self.dest_min:
+            self.dest_min = floor
+        elif floor > self.dest_max:
+            self.dest_max = floor
+        self.dest_count += 1
+
+    cdef inline void drop_off_at_current_floor(self) noexcept nogil:
+        cdef int floor = self.current_floor
+        cdef int bit = floor - self.lowest_floor
+
+        if bit < 0 or bit >= self.destinations.shape[0] or not self.destinations[bit]:
+            return
+
+        self.destinations[bit] = 0
+        self.dest_count -= 1
+
+        # Only rescan the remaining destinations when a bound was dropped off
+        if self.dest_count == 0:
+            return
+        if floor == self.dest_min:
+            while not self.destinations[self.dest_min - self.lowest_floor]:
+                self.dest_min += 1
+        elif floor == self.dest_max:
+            while not self.destinations[self.dest_max - self.lowest_floor]:
+                self.dest_max -= 1
+
+    cdef inline void move_core(self) noexcept nogil:
+        cdef int floor = self.current_floor
+        cdef bint has_destinations = self.dest_count > 0
+        cdef bint has_pickup = self.queue_end > self.queue_start
+        cdef int pickup_floor = 0
+        cdef int delta
+
+        if has_pickup:
+            pickup_floor = self.request_floor[self.queue[self.queue_start]]
+
+        # If elevator is idle then handle the first available pickup or drop off
+        # request. The step is the sign of the distance to the target.
+        if self.direction == IDLE:
+            if has_pickup:
+                delta = (pickup_floor > floor) - (pickup_floor < floor)
+                self.current_floor = floor + delta
+                self.direction = delta
+            elif has_destinations:
+                delta = (self.dest_max > floor) - (self.dest_max < floor)
+                self.current_floor = floor + delta
+                self.direction = delta
+
+        elif self.direction == UP:
+            if (has_destinations and self.dest_max > floor) or (
+                has_pickup and pickup_floor > floor
+            ):
+                self.current_floor = floor + 1
+            elif has_destinations or has_pickup:
+                self.current_floor = floor - 1
+                self.direction = DOWN
+            else:
+                self.direction = IDLE
+
+        elif self.direction == DOWN:
+            if (has_destinations and self.dest_min < floor) or (
+                has_pickup and pickup_floor < floor
+            ):
+                self.current_floor = floor - 1
+            elif has_destinations or has_pickup:
+                self.current_floor = floor + 1
+                self.direction = UP
+            else:
+                self.direction = IDLE
+
+    cdef inline void handle_parallel_requests(self) noexcept nogil:
+        # Pickup any passengers along the way of the current request
+        cdef int floor = self.current_floor
+        cdef int direction = self.direction
+        cdef int lead_direction, request, index
+        cdef int write = self.queue_start
+
+        if self.queue_end == self.queue_start:
+            return
+
+        # A single pending request is always the lead request, check it directly
+        if self.queue_end - self.queue_start == 1:
+            request = self.queue[self.queue_start]
+            if (
+                self.request_floor[request] == floor
+                and self.request_direction[request] == direction
+            ):
+                self.queue_start += 1
+                self.request_floor_at(self.request_destination[request])
+            return
+
+        # Compact the queue in place, keeping requests that are not picked up in
+        # their original order
+        lead_direction = self.request_direction[self.queue[self.queue_start]]
+        for index in range(self.queue_start, self.queue_end):
+            request = self.queue[index]
+            if (
+                self.request_floor[request] == floor
+                and self.request_direction[request] == lead_direction
+                and lead_direction == direction
+            ):
+                self.request_floor_at(self.request_destination[request])
+            else:
+                self.queue[write] = request
+                write += 1
+        self.queue_end = write
+
+    cdef inline void move(self) noexcept nogil:
+        cdef int request
+
+        # Pickup the lead request and drop off passengers at the current floor before
+        # the elevator leaves it
+        if self.queue_end > self.queue_start:
+            request = self.queue[self.queue_start]
+            if self.request_floor[request] == self.current_floor:
+                self.queue_start += 1
+                self.direction = self.request_direction[request]
+                self.request_floor_at(self.request_destination[request])
+        self.drop_off_at_current_floor()
+
+        self.move_core()
+        self.handle_parallel_requests()
+
+        # If no requests exist then become idle
+        if not self.has_pending_requests():
+            self.direction = IDLE
+
+    cpdef list run(self, requests, bint record=False):
+        # Simulate requests the same way ElevatorController.run does. When record is
+        # set, returns the (time, floor, direction) state after every tick, otherwise
+        # an empty list.
+        cdef int count = len(requests)
+        cdef int lowest = self.current_floor
+        cdef int highest = self.current_floor
+        cdef long[::1] times
+        cdef int[::1] release_order
+        cdef int released = 0
+        cdef int index, request
+        cdef list trace = []
+
+        self.request_floor = array_of(count)
+        self.request_direction = array_of(count)
+        self.request_destination = array_of(count)
+        self.queue = array_of(count)
+        self.queue_start = 0
+        self.queue_end = 0
+        times = array_of(count, "l")
+
+        for index, pickup in enumerate(requests):
+            times[index] = pickup.time
+            self.request_floor[index] = pickup.floor
+            self.request_direction[index] = pickup.direction.value
+            self.request_destination[index] = pickup.destination
+            lowest = min(lowest, pickup.floor, pickup.destination)
+            highest = max(highest, pickup.floor, pickup.destination)
+
+        # Release order by time, same-time requests newest first
+        release_order = array_of(count)
+        for index, (_, request) in enumerate(
+            sorted([(times[i], -i) for i in range(count)])
+        ):
+            release_order[index] = -request
+
+        self.lowest_floor = lowest
+        self.destinations = bytearray(highest - lowest + 1)
+        self.dest_count = 0
+
+        while released < count or self.has_pending_requests():
+            # Fast-forward through idle ticks until the next request arrives
+            if (
+                not self.has_pending_requests()
+                and times[release_order[released]] > self.time
+            ):
+                self.time = times[release_order[released]]
+
+            while released < count and times[release_order[released]] <= self.time:
+                self.queue[self.queue_end] = release_order[released]
+                self.queue_end += 1
+                released += 1
+
+            self.move()
+            if record:
+                trace.append((self.time, self.current_floor, self.direction))
+            self.time += 1
+
+        return trace
+
+
+cdef object array_of(int count, str typecode="i"):
+    from array import array
+
+    return array(typecode, bytes(count * array(typecode).itemsize))
@@ -0,0 +1,144 @@
+import logging
+import random
+import unittest
+
+from Elevator import (
+    Direction,
+    Elevator,
+    ElevatorBank,
+    ElevatorController,
+    PickupRequest,
+    _IDLE,
+    np,
+)
+
+
+def random_schedule(rng, floors, length, lowest_floor=1):
+    schedule = []
+    for _ in range(rng.randint(1, 15)):
+        floor = rng.randint(lowest_floor, floors)
+        destination = rng.choice(
+            [f for f in range(lowest_floor, floors + 1) if f != floor]
+        )
+        direction = Direction.UP if destination > floor else Direction.DOWN
+        schedule.append((rng.randint(0, length // 5), floor, direction, destination))
+    return schedule
+
+
+class RecordingElevator(Elevator):
+
+    def __init__(self, floors, starting_floor=1):
+        super().__init__(floors, starting_floor)
+        self.trace = []
+
+    def move(self, time):
+        super().move(time)
+        self.trace.append((time, self.current_floor, self.direction))
+
+
+class RecordingBank(ElevatorBank):
+
+    def __init__(self, count, starting_floor=1):
+        super().__init__(count, starting_floor)
+        self.trace = []
+
+    def move(self, time):
+        super().move(time)
+        self.trace.append((time, self.current_floor.copy(), self.direction.copy()))
+
+
+@unittest.skipIf(np is None, "ElevatorBank requires numpy")
+class ElevatorBankTest(unittest.TestCase):
+    # ElevatorBank must step every elevator exactly as an independent Elevator would.
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def assert_matches_elevators(self, schedules, floors, ticks, starting_floor=1):
+        elevators = [Elevator(floors, starting_floor) for _ in schedules]
+        bank = ElevatorBank(len(schedules), starting_floor)
+
+        for time in range(ticks):
+            for index, schedule in enumerate(schedules):
+                for request_time, floor, direction, destination in schedule:
+                    if request_time == time:
+                        request = (time, floor, direction, destination)
+                        elevators[index].request_car(PickupRequest(*request))
+                        bank.request_car(index, PickupRequest(*request))
+
+            for elevator in elevators:
+                elevator.move(time)
+            bank.move(time)
+
+            for index, elevator in enumerate(elevators):
+                state = (time, index)
+                self.assertEqual(
+                    elevator.current_floor, bank.current_floor[index], state
+                )
+                self.assertEqual(elevator.direction, bank.direction[index], state)
+                self.assertEqual(
+                    set(elevator.destination_requests),
+                    bank.destination_requests[index],
+                    state,
+                )
+                self.assertEqual(
+                    [request.floor for request in elevator.pickup_requests],
+                    [request.floor for request in bank.pickup_requests[index]],
+                    state,
+                )
+
+        self.assertFalse(bank.has_pending_requests())
+
+    def test_random_schedules(self):
+        rng = random.Random(0)
+        schedules = [random_schedule(rng, 20, 300) for _ in range(40)]
+        self.assert_matches_elevators(schedules, floors=20, ticks=300)
+
+    def test_random_schedules_with_basement_floors(self):
+        rng = random.Random(1)
+        schedules = [random_schedule(rng, 10, 300, lowest_floor=-5) for _ in range(40)]
+        self.assert_matches_elevators(
+            schedules, floors=10, ticks=300, starting_floor=0
+        )
+
+    def test_run_matches_controllers(self):
+        rng = random.Random(2)
+        schedules = [random_schedule(rng, 20, 300) for _ in range(40)]
+
+        traces = []
+        for schedule in schedules:
+            elevator = RecordingElevator(20)
+            requests = [PickupRequest(*request) for request in schedule]
+            ElevatorController(elevator, requests).run()
+            traces.append(elevator.trace)
+
+        bank = RecordingBank(len(schedules))
+        bank.run(
+            [
+                [PickupRequest(*request) for request in schedule]
+                for schedule in schedules
+            ]
+        )
+        self.assertFalse(bank.has_pending_requests())
+
+        # Each controller only skips ticks where its elevator sits idle, so the bank
+        # must match it on every tick it ran and be idle in place otherwise
+        for index, trace in enumerate(traces):
+            moved_at = {time for time, _, _ in trace}
+            bank_trace = [
+                (time, int(floors[index]), int(directions[index]))
+                for time, floors, directions in bank.trace
+            ]
+            self.assertEqual(
+                trace, [state for state in bank_trace if state[0] in moved_at], index
+            )
+            for previous, state in zip(bank_trace, bank_trace[1:]):
+                if state[0] not in moved_at:
+                    self.assertEqual(state[1:], (previous[1], _IDLE), index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import logging
+import unittest
+
+from Elevator import Direction, Elevator, ElevatorController, PickupRequest, _IDLE
+
+
+SAMPLE_REQUESTS = [
+    (1, 5, Direction.DOWN, 2),
+    (2, 8, Direction.UP, 10),
+    (3, 4, Direction.UP, 9),
+    (7, 5, Direction.DOWN, 1),
+]
+
+# Matches the sample output documented at the bottom of Elevator.py
+SAMPLE_LOG = [
+    "INFO:Elevator:{'time': 1, 'direction': 'Up', 'floor': 2}",
+    "INFO:Elevator:{'time': 2, 'direction': 'Up', 'floor': 3}",
+    "INFO:Elevator:{'time': 3, 'direction': 'Up', 'floor': 4}",
+    "INFO:Elevator:{'time': 4, 'direction': 'Up', 'floor': 5}",
+    "DEBUG:Elevator:Time: 5 - Picking up passengers at 5",
+    "INFO:Elevator:{'time': 5, 'direction': 'Down', 'floor': 4}",
+    "INFO:Elevator:{'time': 6, 'direction': 'Down', 'floor': 3}",
+    "INFO:Elevator:{'time': 7, 'direction': 'Down', 'floor': 2}",
+    "DEBUG:Elevator:Time: 8 - Dropping off passengers at 2",
+    "INFO:Elevator:{'time': 8, 'direction': 'Up', 'floor': 3}",
+    "DEBUG:Elevator:Time: 9 - Picking up passengers at 4",
+    "INFO:Elevator:{'time': 9, 'direction': 'Up', 'floor': 4}",
+    "INFO:Elevator:{'time': 10, 'direction': 'Up', 'floor': 5}",
+    "INFO:Elevator:{'time': 11, 'direction': 'Up', 'floor': 6}",
+    "INFO:Elevator:{'time': 12, 'direction': 'Up', 'floor': 7}",
+    "DEBUG:Elevator:Time: 13 - Picking up passengers at 8",
+    "INFO:Elevator:{'time': 13, 'direction': 'Up', 'floor': 8}",
+    "INFO:Elevator:{'time': 14, 'direction': 'Up', 'floor': 9}",
+    "DEBUG:Elevator:Time: 15 - Dropping off passengers at 9",
+    "INFO:Elevator:{'time': 15, 'direction': 'Up', 'floor': 10}",
+    "DEBUG:Elevator:Time: 16 - Dropping off passengers at 10",
+    "INFO:Elevator:{'time': 16, 'direction': 'Down', 'floor': 9}",
+    "INFO:Elevator:{'time': 17, 'direction': 'Down', 'floor': 8}",
+    "INFO:Elevator:{'time': 18, 'direction': 'Down', 'floor': 7}",
+    "INFO:Elevator:{'time': 19, 'direction': 'Down', 'floor': 6}",
+    "DEBUG:Elevator:Time: 20 - Picking up passengers at 5",
+    "INFO:Elevator:{'time': 20, 'direction': 'Down', 'floor': 5}",
+    "INFO:Elevator:{'time': 21, 'direction': 'Down', 'floor': 4}",
+    "INFO:Elevator:{'time': 22, 'direction': 'Down', 'floor': 3}",
+    "INFO:Elevator:{'time': 23, 'direction': 'Down', 'floor': 2}",
+    "INFO:Elevator:{'time': 24, 'direction': 'Down', 'floor': 1}",
+    "DEBUG:Elevator:Time: 25 - Dropping off passengers at 1",
+    "INFO:Elevator:{'time': 25, 'direction': 'Idle', 'floor': 1}",
+]
+
+
+def pickup_requests(schedule):
+    return [PickupRequest(*request) for request in schedule]
+
+
+class RecordingElevator(Elevator):
+
+    def __init__(self, floors, starting_floor=1):
+        super().__init__(floors, starting_floor)
+        self.trace = []
+
+    def move(self, time):
+        super().move(time)
+        self.trace.append((time, self.current_floor, self.direction))
+
+
+class ReleaseOrder:
+    # Stands in for an elevator and records the floor of each released request
+
+    def __init__(self):
+        self.released = []
+
+    def has_pending_requests(self):
+        return False
+
+    def request_car(self, request):
+        self.released.append(request.floor)
+
+    def move(self, time):
+        pass
+
+
+class ElevatorControllerTest(unittest.TestCase):
+
+    def test_sample_schedule_log(self):
+        controller = ElevatorController(
+            Elevator(10), pickup_requests(SAMPLE_REQUESTS)
+        )
+        with self.assertLogs("Elevator", level=logging.DEBUG) as logs:
+            controller.run()
+
+        self.assertEqual(logs.output, SAMPLE_LOG)
+
+    def test_same_time_requests_released_newest_first(self):
+        elevator = ReleaseOrder()
+        schedule = [
+            (0, 2, Direction.UP, 9),
+            (1, 3, Direction.UP, 9),
+            (1, 4, Direction.UP, 9),
+            (1, 5, Direction.UP, 9),
+        ]
+        ElevatorController(elevator, pickup_requests(schedule)).run()
+
+        self.assertEqual(elevator.released, [2, 5, 4, 3])
+
+    def test_idle_gaps_are_skipped(self):
+        schedule = [
+            (2, 5, Direction.DOWN, 2),
+            (3, 6, Direction.DOWN, 1),
+            (400, 8, Direction.UP, 10),
+            (400, 3, Direction.UP, 7),
+        ]
+
+        logging.disable(logging.CRITICAL)
+        try:
+            controlled = RecordingElevator(10)
+            ElevatorController(controlled, pickup_requests(schedule)).run()
+
+            # Tick every step and release same-time requests newest first
+            stepped = RecordingElevator(10)
+            requests = pickup_requests(schedule)
+            for time in range(controlled.trace[-1][0] + 1):
+                for request in reversed(requests):
+                    if request.time == time:
+                        stepped.request_car(request)
+                stepped.move(time)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        # The controller never moves the elevator while it waits for a request
+        moved_at = {time for time, _, _ in controlled.trace}
+        self.assertNotIn(0, moved_at)
+        self.assertFalse(moved_at & set(range(30, 400)))
+
+        # Every tick the controller ran matches ticking every step, and every
+        # skipped tick leaves the elevator idle where it was
+        self.assertEqual(
+            controlled.trace,
+            [state for state in stepped.trace if state[0] in moved_at],
+        )
+        for previous, state in zip(stepped.trace, stepped.trace[1:]):
+            if state[0] not in moved_at:
+                self.assertEqual(state[1:], (previous[1], _IDLE))
+
+
+if __name__ == "__main__":
+    unittest.main()
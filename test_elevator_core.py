@@ -0,0 +1,80 @@
+import logging
+import random
+import unittest
+
+from Elevator import Direction, Elevator, ElevatorController, PickupRequest
+
+try:
+    from elevator_core import CElevator
+except ImportError:
+    CElevator = None
+
+
+def random_schedule(rng, floors, length, lowest_floor=1):
+    schedule = []
+    for _ in range(rng.randint(1, 30)):
+        floor = rng.randint(lowest_floor, floors)
+        destination = rng.choice(
+            [f for f in range(lowest_floor, floors + 1) if f != floor]
+        )
+        direction = Direction.UP if destination > floor else Direction.DOWN
+        schedule.append((rng.randint(0, length), floor, direction, destination))
+    return schedule
+
+
+class RecordingElevator(Elevator):
+
+    def __init__(self, floors, starting_floor=1):
+        super().__init__(floors, starting_floor)
+        self.trace = []
+
+    def move(self, time):
+        super().move(time)
+        self.trace.append((time, self.current_floor, self.direction))
+
+
+@unittest.skipIf(CElevator is None, "elevator_core has not been built")
+class CElevatorTest(unittest.TestCase):
+    # CElevator.run must produce the same per-tick states as ElevatorController
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def assert_matches_controller(self, schedule, starting_floor=1):
+        elevator = RecordingElevator(20, starting_floor)
+        controller = ElevatorController(
+            elevator, [PickupRequest(*request) for request in schedule]
+        )
+        controller.run()
+
+        compiled = CElevator(starting_floor)
+        trace = compiled.run(
+            [PickupRequest(*request) for request in schedule], record=True
+        )
+
+        self.assertEqual(trace, elevator.trace, schedule)
+        self.assertEqual(compiled.time, controller.time)
+
+    def test_random_schedules(self):
+        rng = random.Random(0)
+        for _ in range(300):
+            self.assert_matches_controller(random_schedule(rng, 20, 100))
+
+    def test_random_schedules_with_basement_floors(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            self.assert_matches_controller(
+                random_schedule(rng, 10, 100, lowest_floor=-5), starting_floor=0
+            )
+
+    def test_no_requests(self):
+        compiled = CElevator()
+        self.assertEqual(compiled.run([], record=True), [])
+        self.assertEqual(compiled.time, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()